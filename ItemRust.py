@@ -5,6 +5,7 @@ from enum import Enum
 
 import aiohttp
 
+from ItemRustArchive import ItemRustArchive
 from ItemRustDatabase import ItemRustDatabase
 from Result import Result
 
@@ -17,6 +18,7 @@ class ItemRust:
 
     session: aiohttp.ClientSession = None
     database: ItemRustDatabase = None
+    archive: ItemRustArchive = None
     item_updating_semaphores = dict()
 
     class PriceType(Enum):
@@ -35,6 +37,13 @@ class ItemRust:
             raise AttributeError("Database has to be instance of ", ItemRustDatabase.__name__)
         cls.database: ItemRustDatabase = database
 
+    @classmethod
+    def set_archive(cls, archive):
+        """ Set archive for recording API responses or replaying them offline. None disables it."""
+        if archive is not None and not isinstance(archive, ItemRustArchive):
+            raise AttributeError("Archive has to be instance of ", ItemRustArchive.__name__)
+        cls.archive: ItemRustArchive = archive
+
     def __init__(self, name, quantity=1, price_rchshop=None, price_rch_bet=None):
         """
 
@@ -368,6 +377,9 @@ class ItemRust:
         if cookies is None: cookies = {}
         errors = []
 
+        if self.archive is not None and self.archive.is_replaying:
+            return self._get_json_from_archive(url, params)
+
         for attempt in range(attempts):
             if attempt > 0:
                 await asyncio.sleep(delay_ms / 1000)
@@ -376,6 +388,10 @@ class ItemRust:
                                               params=params,
                                               headers={**self.DEFAULT_HEADERS, **headers},
                                               cookies={**cookies})
+            if response.status in (200, 404) and self.archive is not None and self.archive.is_recording:
+                text = await response.text()
+                self.archive.add_response(url, params, response.status, response.reason, text)
+
             if response.status == 200:
                 json_result = json.loads(await response.text())
                 return Result(json_result)
@@ -391,6 +407,15 @@ class ItemRust:
         errors.append("Attempt limit reached")
         return Result(success=False, errors=errors)
 
+    def _get_json_from_archive(self, url, params=None):
+        """ Serves response of GET request from archive, without making any request"""
+        stored = self.archive.get_response(url, params)
+        if stored is None:
+            return Result(success=False, errors=[f"Not in archive: {ItemRustArchive.make_key(url, params)}"])
+        if stored["status"] == 200:
+            return Result(json.loads(stored["text"]))
+        return Result(success=False, errors=[f"{stored['status']}: {stored['reason']}"])
+
     @staticmethod
     def _today_frac():
         # Fraction of today, matters with low values of days_back
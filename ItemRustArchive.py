@@ -0,0 +1,114 @@
+import gzip
+import json
+import os
+from enum import Enum
+from urllib.parse import urlencode
+
+import aiofiles
+
+
+class ItemRustArchive:
+    """ On-disk archive of SCMM API responses, used to record live requests and replay them offline"""
+    _verbose_level = 1
+
+    class Mode(Enum):
+        RECORD = 1
+        REPLAY = 2
+
+    def __init__(self, filename, mode=Mode.RECORD):
+        """
+
+        :param filename: name of the archive file (gzip compressed json)
+        :type filename: str
+        :param mode: RECORD stores every live response, REPLAY serves responses from the archive without network
+        :type mode: ItemRustArchive.Mode
+        """
+        if not isinstance(mode, ItemRustArchive.Mode):
+            raise AttributeError("Mode has to be instance of ", ItemRustArchive.Mode.__name__)
+        self.filename = filename
+        self.mode = mode
+        self.records: dict[str, dict] = {}
+
+    @property
+    def is_replaying(self):
+        return self.mode == ItemRustArchive.Mode.REPLAY
+
+    @property
+    def is_recording(self):
+        return self.mode == ItemRustArchive.Mode.RECORD
+
+    def is_empty(self):
+        return not self.records
+
+    @staticmethod
+    def make_key(url, params=None):
+        """ Index key of a request. Params are sorted so the key doesn't depend on their order"""
+        if not params:
+            return url
+        return url + "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def has_response(self, url, params=None):
+        return self.make_key(url, params) in self.records
+
+    def get_response(self, url, params=None):
+        """ Returns stored response as dict with keys "status", "reason", "text" or None if not in archive"""
+        return self.records.get(self.make_key(url, params))
+
+    def add_response(self, url, params, status, reason, text):
+        """ Store response of a request, replacing previous one with the same key"""
+        self.records[self.make_key(url, params)] = {"status": status, "reason": reason, "text": text}
+
+    def load_archive(self):
+        """ Load self.records from file. Returns True if loaded archive, False if error or empty archive."""
+        if not os.path.exists(self.filename):
+            print(f"File '{self.filename}' does not exist.")
+            return False
+
+        try:
+            with gzip.open(self.filename, 'rt', encoding='utf-8') as file:
+                data = file.read()
+        except (OSError, EOFError) as e:
+            print(f"Error while reading archive {self.filename}:\n", e)
+            return False
+
+        if not data:
+            print(f"File '{self.filename}' is empty")
+            return False
+
+        try:
+            jsondata = json.loads(data)
+        except json.decoder.JSONDecodeError as e:
+            print(f"Error while decoding json data from {self.filename}:\n", e)
+            return False
+
+        self.records = jsondata
+        return True
+
+    def _encode(self):
+        return gzip.compress(json.dumps(self.records, separators=(',', ':')).encode('utf-8'))
+
+    def save_archive(self):
+        """ Save self.records to file"""
+        if not self.is_empty():
+            if ItemRustArchive._verbose_level >= 1:
+                print("Saving archive")
+            with open(self.filename, 'wb') as f:
+                f.write(self._encode())
+            if ItemRustArchive._verbose_level >= 1:
+                print("Archive saved")
+        else:
+            if ItemRustArchive._verbose_level >= 1:
+                print("Not saving archive - empty")
+
+    async def save_archive_async(self):
+        """ Save self.records to file asynchronously"""
+        if not self.is_empty():
+            if ItemRustArchive._verbose_level >= 1:
+                print("Saving archive async")
+            async with aiofiles.open(self.filename, 'wb') as f:
+                await f.write(self._encode())
+            if ItemRustArchive._verbose_level >= 1:
+                print("Archive saved")
+        else:
+            if ItemRustArchive._verbose_level >= 1:
+                print("Not saving archive - empty")